@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013 Infrae. All rights reserved.
+# See also LICENSE.txt
+"""Measure the cost of importing and using ``silva.core.interfaces``.
+
+Usage::
+
+  python benchmarks/bench_interfaces.py [--iterations N] [--output FILE]
+
+The result is a JSON document that can be compared between releases.
+"""
+
+import argparse
+import compileall
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+
+MODULES = [
+    'silva.core.interfaces',
+    'silva.core.interfaces.content',
+    'silva.core.interfaces.extension',
+    'silva.core.interfaces.registry',
+    'silva.core.interfaces.service',
+    'silva.core.interfaces.adapters',
+    'silva.core.interfaces.events',
+    'silva.core.interfaces.auth',
+    'silva.core.interfaces.errors',
+    'silva.core.interfaces.silvaxml',
+    'silva.core.interfaces:ISilvaObject',
+    'silva.core.interfaces:IVersion',
+    'silva.core.interfaces:*',
+    ]
+
+CHAIN = [
+    'ISilvaObject',
+    'IPublishable',
+    'IContainer',
+    'IFolder',
+    'IPublication',
+    'IRoot',
+    ]
+
+# Run in a fresh interpreter so that the import is cold.
+IMPORT_SCRIPT = """
+import json, os, sys, time
+
+def rss():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (IOError, OSError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+modules = len(sys.modules)
+memory = rss()
+start = time.time()
+exec(%(statement)r)
+elapsed = time.time() - start
+print(json.dumps({
+    'wall_time': elapsed,
+    'modules_loaded': len(sys.modules) - modules,
+    'rss_delta': rss() - memory}))
+"""
+
+
+def compile_package():
+    """Compile the modules of the package, so that the cold imports
+    don't depend on whether they were already compiled.
+    """
+    from silva.core import interfaces
+
+    compileall.compile_dir(os.path.dirname(interfaces.__file__), quiet=1)
+
+
+def measure_import(module, repeat):
+    """Import ``module`` in ``repeat`` fresh interpreters and return
+    the best wall time, with the number of loaded modules and the
+    memory used by the import. ``module`` can be ``module:name`` to
+    import only name from module, or ``module:*`` to import all of
+    its names.
+    """
+    if ':' in module:
+        statement = 'from %s import %s' % tuple(module.split(':'))
+    else:
+        statement = 'import %s' % module
+    results = []
+    for i in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', IMPORT_SCRIPT % {'statement': statement}])
+        results.append(json.loads(output.decode('utf-8')))
+    results.sort(key=lambda result: result['wall_time'])
+    return results[0]
+
+
+def measure_resolution(iterations):
+    """Time ``providedBy``, ``isOrExtends`` and adapter lookups on the
+    content hierarchy. Interfaces are bound to local names first, so
+    that module attribute lookups are not measured.
+    """
+    from zope.interface import implementer, providedBy
+    from zope.interface.adapter import AdapterRegistry
+    from silva.core import interfaces
+
+    ISilvaObject = interfaces.ISilvaObject
+    results = {}
+    registry = AdapterRegistry()
+    for name in CHAIN:
+        iface = getattr(interfaces, name)
+        content = implementer(iface)(type(name[1:], (object,), {}))()
+        spec = providedBy(content)
+        provided_by = ISilvaObject.providedBy
+        results['providedBy.' + name] = timeit.timeit(
+            lambda: provided_by(content),
+            number=iterations)
+        results['isOrExtends.' + name] = timeit.timeit(
+            lambda: spec.isOrExtends(ISilvaObject),
+            number=iterations)
+
+    adapters = [
+        ('IPublicationWorkflow', 'IVersionedContent'),
+        ('ITreeContents', 'IContainer'),
+        ('IOrderManager', 'IOrderableContainer')]
+    for provided_name, required_name in adapters:
+        provided = getattr(interfaces, provided_name)
+        required = getattr(interfaces, required_name)
+        registry.register([required], provided, '', lambda context: context)
+    content = implementer(interfaces.IFolder)(type('Folder', (object,), {}))()
+    version = implementer(interfaces.ILink)(type('Link', (object,), {}))()
+    for provided_name, required_name in adapters:
+        provided = getattr(interfaces, provided_name)
+        context = version if provided_name == 'IPublicationWorkflow' else content
+        results['queryAdapter.' + provided_name] = timeit.timeit(
+            lambda: registry.queryAdapter(context, provided),
+            number=iterations)
+    return results
+
+
+def measure_hierarchy(iterations, size=1000):
+    """Compare ``providedBy`` with the classification flags of
+    ``silva.core.interfaces.hierarchy``, for a single check and for a
+    listing of ``size`` contents tested against the six interfaces a
+    listing usually asks about. Functions and interfaces are bound to
+    local names first, so that module attribute lookups are not
+    measured.
+    """
+    from zope.interface import implementer
+    from silva.core import interfaces
+    from silva.core.interfaces import hierarchy
+
+    classes = [
+        implementer(iface)(type(iface.__name__[1:], (object,), {}))
+        for iface in (interfaces.IRoot, interfaces.IFolder,
+                      interfaces.IFile, interfaces.ILink,
+                      interfaces.IGhost)]
+    contents = [classes[index % len(classes)]() for index in range(size)]
+    tested = [
+        interfaces.IContainer, interfaces.IPublishable,
+        interfaces.INonPublishable, interfaces.IAsset,
+        interfaces.IGhostAware, interfaces.IVersionedContent]
+    content = contents[0]
+    provided_by = interfaces.IContainer.providedBy
+    get_flags = hierarchy.get_flags
+    classify = hierarchy.classify
+    CONTAINER = hierarchy.CONTAINER
+    classify(contents)
+
+    def provided_by_listing():
+        for content in contents:
+            for iface in tested:
+                iface.providedBy(content)
+
+    listings = max(1, iterations // size)
+    return {
+        'hierarchy.single.providedBy': timeit.timeit(
+            lambda: provided_by(content),
+            number=iterations),
+        'hierarchy.single.get_flags': timeit.timeit(
+            lambda: get_flags(content) & CONTAINER,
+            number=iterations),
+        'hierarchy.listing.providedBy': timeit.timeit(
+            provided_by_listing, number=listings),
+        'hierarchy.listing.classify': timeit.timeit(
+            lambda: classify(contents), number=listings)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--iterations', type=int, default=100000,
+        help='number of calls for each resolution measure')
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help='number of cold imports done for each module')
+    parser.add_argument(
+        '--output', default=None,
+        help='file to write the JSON report to (default to stdout)')
+    options = parser.parse_args()
+
+    compile_package()
+    report = {
+        'python': sys.version.split()[0],
+        'iterations': options.iterations,
+        'imports': dict(
+            (module, measure_import(module, options.repeat))
+            for module in MODULES),
+        'resolution': measure_resolution(options.iterations),
+        'hierarchy': measure_hierarchy(options.iterations)}
+    data = json.dumps(report, indent=2, sort_keys=True)
+    if options.output:
+        with open(options.output, 'w') as output:
+            output.write(data + '\n')
+    else:
+        print(data)
+
+
+if __name__ == '__main__':
+    main()
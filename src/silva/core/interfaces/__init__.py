@@ -2,7 +2,7 @@
 # Copyright (c) 2002-2013 Infrae. All rights reserved.
 # See also LICENSE.txt
 
-from zope.interface import Interface
+from zope.interface import Interface, Attribute
 
 
 class RequiredParameterNotSetError(Exception):
@@ -48,6 +48,29 @@ class IMimeTypeClassifier(Interface):
         """
 
 
+class ICachedMimeTypeClassifier(IMimeTypeClassifier):
+    """Classifier that caches its results in a bounded LRU cache.
+
+    Buffers are first matched against a table of signatures that are
+    enough, on their own, to decide the type (like PNG, JPEG, GIF or
+    PDF). Only those results are cached by prefix. Formats sharing a
+    prefix (zip based formats like docx, odt or jar, or text, XML
+    and HTML) are sniffed from the whole buffer, and the result is
+    cached by the digest of the buffer.
+
+    ``guess_type`` results for a filename without buffer are cached
+    by extension. ``guess_file_type`` sniffs the content of the file,
+    so its results are not cached by filename or extension.
+    """
+    max_size = Attribute(u"Maximum number of cached results.")
+    hits = Attribute(u"Number of results found in the cache.")
+    misses = Attribute(u"Number of results not found in the cache.")
+
+    def clear():
+        """Empty the cache and reset the counters.
+        """
+
+
 class IUpgrader(Interface):
     """Upgraders takes an object and modify its attributes in order to
     make it conform to a newer version of Silva.
@@ -64,6 +87,20 @@ class IUpgrader(Interface):
         change.
         """
 
+
+class IStaticUpgrader(IUpgrader):
+    """Upgraders which can tell in advance to which content classes
+    they apply.
+    """
+
+    def applies(content_class):
+        """Return True if the upgrader can apply to instances of
+        content_class. It is called only once per class, and
+        ``validate`` is only called on instances of classes for which
+        it returned True.
+        """
+
+
 class IPostUpgrader(Interface):
     """Post upgraders execute themselves after regular upgraders.
     """
@@ -31,6 +31,25 @@ class IArchiveFileImporter(IContentImporter):
         """
 
 
+class IParallelArchiveFileImporter(IArchiveFileImporter):
+    """Archive importer that decompresses and detects the content
+    type of the archive members in a pool of workers. Assets are
+    still created in the ZODB by the calling thread, in the order of
+    the archive.
+    """
+    workers = Attribute(
+        u"Default number of workers used to process the members.")
+
+    def importArchive(archivefile, assettitle=None, recreatedirs=1,
+                      replace=0, workers=None):
+        """Import archive file like ``IArchiveFileImporter``, using
+        workers instead of the default number of workers if it is
+        given.
+
+        Return the same tuple of succeeded and failed items.
+        """
+
+
 class IZipFileImporter(IContentImporter):
 
     def isFullmediaArchive(input_archive):
@@ -43,6 +62,21 @@ class IZipFileImporter(IContentImporter):
         """
 
 
+class IStreamingZipFileImporter(IZipFileImporter):
+    """Zip importer that uses a bounded amount of memory, whatever
+    the size of the archive.
+    """
+
+    def importFromZip(input_archive, request, replace=False):
+        """Import Silva content from a full media opened zip file,
+        optionally replacing content. The Silva XML manifest is read
+        incrementally and its events are given to the
+        ``ISilvaXMLHandler`` handlers as they are parsed. A binary
+        member of the archive is only read when the content using it
+        is created.
+        """
+
+
 # BBB
 IZipfileImporter = IZipFileImporter
 
@@ -63,6 +97,65 @@ class IContentExporter(Interface):
         """
 
 
+class IStreamingContentExporter(IContentExporter):
+    """Exporter that writes the export progressively in a file, and
+    that can resume an interrupted export.
+    """
+
+    def export_to(sink, request, checkpoint=None, **options):
+        """Export context with given settings, writing the
+        ``ISilvaXMLProducer`` output and the assets directly to the
+        file-like object sink. Content is exported one at a time.
+
+        If checkpoint is given, the export resumes after the last
+        content exported when that checkpoint was created, in a sink
+        containing the previous output.
+
+        Return a checkpoint that can be used to resume the export.
+        """
+
+    def get_checkpoint():
+        """Return a checkpoint for the export in progress, or None.
+        """
+
+
+class IParallelContentExporter(IContentExporter):
+    """Exporter that splits the exported tree at container
+    boundaries, as given by ``ITreeContents.get_container_tree``, and
+    exports the parts concurrently before merging them.
+
+    Workers are processes: producing XML is CPU bound, and threads
+    would not run it on more than one core at a time. Each worker
+    opens its own connection to the database (it must be shared, like
+    a ZEO server), loads the root of its part by path through it, and
+    writes its part in a temporary file. The export settings are
+    passed to the workers, not the request nor objects loaded with
+    its connection.
+
+    References are checked against the whole exported tree, so an
+    ``IExternalReferenceError`` is only reported for targets outside
+    of it, not for targets in an other part.
+    """
+    workers = Attribute(
+        u"Default number of worker processes exporting parts at the "
+        u"same time.")
+
+    def export(request, workers=None, **options):
+        """Export context with given settings, using workers instead
+        of the default number of workers if it is given.
+        """
+
+    def partition(depth=1):
+        """Return the list of containers used as roots of the
+        exported parts, up to depth levels below the context.
+        """
+
+    def merge(parts, sink):
+        """Merge the files of exported parts into one export,
+        written in the file-like object sink.
+        """
+
+
 class IDefaultContentExporter(IContentExporter):
     """This mark the default content exporter.
     """
@@ -71,7 +164,100 @@ class IDefaultContentExporter(IContentExporter):
 class IAssetPayload(Interface):
 
     def get_payload():
-        """ Get actual data stored for this asset, or None.
+        """ Get actual data stored for this asset, or None. If the
+        data is stored in the ``IContentAddressedStore``, it is read
+        from it.
+        """
+
+
+class IStreamingPayload(Interface):
+    """Adapt a file (``IZODBFile``, ``IFileSystemFile`` or
+    ``IBlobFile``) to read its data by chunks, without loading it
+    completely in memory. It can be used to answer HTTP Range
+    requests.
+
+    ``start`` and ``end`` are byte offsets, ``end`` being excluded.
+    """
+
+    def get_size():
+        """Return the size of the data in bytes.
+        """
+
+    def iter_chunks(chunk_size=65536, start=0, end=None):
+        """Iterate over the data between start and end (or the end of
+        the data if end is None), by chunks of at most chunk_size
+        bytes.
+        """
+
+    def read_range(start, end):
+        """Return the data between start and end. It raises
+        ``ValueError`` if the range is not satisfiable.
+        """
+
+
+class IMappedPayload(Interface):
+    """Adapt a file stored on the disk (``IFileSystemFile`` or
+    ``IBlobFile``) to access its data without copying it in Python.
+
+    The adapter owns the file descriptor and the memory map it
+    opens, and releases them in ``close``. It is used as a context
+    manager::
+
+      with IMappedPayload(content) as payload:
+          fd, offset, length = payload.get_sendfile_range()
+          ...
+    """
+
+    def get_buffer():
+        """Return a read-only ``memoryview`` on a memory map of the
+        data, opening the map if needed. It is only valid until
+        ``close`` is called, and must not be used after.
+        """
+
+    def get_sendfile_range():
+        """Return a tuple (fd, offset, length) that can be given to
+        ``sendfile``, opening the file if needed. The file descriptor
+        is closed by ``close``, not by the caller.
+        """
+
+    def close():
+        """Close the memory map and the file descriptor, if they are
+        opened. It is safe to call it more than once.
+        """
+
+    def __enter__():
+        """Return the adapter itself.
+        """
+
+    def __exit__(exc_type, exc_value, traceback):
+        """Call ``close``.
+        """
+
+
+class IFileUpload(Interface):
+    """Adapt a file to store new data from a stream in a single pass,
+    by chunks of fixed size, so memory usage does not depend on the
+    size of the data.
+    """
+    chunk_size = Attribute(
+        u"Size in bytes of the chunks read from the stream.")
+    size = Attribute(
+        u"Size in bytes of the last uploaded data.")
+    digest = Attribute(
+        u"Hexadecimal SHA-256 digest of the last uploaded data.")
+    content_type = Attribute(
+        u"Content type of the last uploaded data.")
+
+    def upload(stream, content_type=None, content_encoding=None):
+        """Store the data read from stream in the file, computing its
+        size and digest while it is read. If an
+        ``IContentAddressedStore`` is available, each chunk is passed
+        to one of its writers instead, and the digest and the size
+        are the ones returned by the writer. The stream is read only
+        once. If content_type is None, it is detected with
+        ``IMimeTypeClassifier.guess_buffer_type`` on the first chunk.
+        The quota is updated only once, when all the data have been
+        stored.
         """
 
 
@@ -305,6 +491,8 @@ class IPublicationWorkflow(Interface):
 
 class IAddableContents(Interface):
     """Return addables that can be added in the adapted container.
+
+    Results can be cached with the help of ``IAddableContentsCache``.
     """
 
     def get_authorized_addables(require=None):
@@ -386,6 +574,67 @@ class IContainerManager(Interface):
         """
 
 
+class IContainerEventBatch(Interface):
+    """Collect events fired on a container during a bulk operation,
+    for instance with the ``IContainerManager`` coroutines. It is used
+    as a context manager::
+
+      with IContainerEventBatch(container):
+          with IContainerManager(container).deleter() as deleter:
+              ...
+
+    On enter, the batch registers itself as the active batch of the
+    container in the current thread, and unregisters on exit.
+    Adapting a container returns its active batch in the current
+    thread if there is one, and a new inactive batch otherwise.
+
+    The code firing an event on the container or on one of its
+    contents (like the ``IContainerManager`` coroutines) must pass it
+    to ``IContainerEventBatch(container).collect`` before calling
+    ``notify``, so that it is marked before any subscriber sees it.
+    Collecting from a subscriber is not supported, as subscribers
+    are called in no particular order.
+
+    Collected events are still dispatched individually to all
+    subscribers, but they are marked with ``IBatchedEvent``. When the
+    context manager exits without error, one
+    ``IContentEventsBatchedEvent`` containing all of them is
+    dispatched as well.
+
+    Subscribers that want to process the events in a single call opt
+    in by ignoring the events marked with ``IBatchedEvent``, and by
+    subscribing to ``IContentEventsBatchedEvent``. Other subscribers
+    are not affected.
+    """
+    collected = Attribute(
+        u"Interfaces of the events to collect, by default "
+        u"IContentCreatedEvent, IObjectMovedEvent (that includes "
+        u"IObjectAddedEvent and IObjectRemovedEvent) and "
+        u"IContentOrderChangedEvent.")
+    active = Attribute(
+        u"True if the batch is the active batch of the container.")
+    events = Attribute(
+        u"List of the events collected so far.")
+
+    def collect(event):
+        """Collect event and mark it with ``IBatchedEvent`` if it is
+        one of the collected events and the batch is active. Return
+        True if the event was collected, False otherwise. It must be
+        called before dispatching the event, and the event must be
+        dispatched in both cases.
+        """
+
+    def __enter__():
+        """Register the batch as the active batch of the container in
+        the current thread, and start collecting events.
+        """
+
+    def __exit__(exc_type, exc_value, traceback):
+        """Stop collecting events, unregister the batch and dispatch
+        an ``IContentEventsBatchedEvent`` with all of them.
+        """
+
+
 class IOrderManager(Interface):
     """Manage order of a container content.
     """
@@ -405,9 +654,24 @@ class IOrderManager(Interface):
         Return true in case of success, False in case of failure.
         """
 
+    def move_many(contents, index):
+        """Move all the given contents just before index, keeping
+        their relative order. Only one
+        ``IContainerOrderChangedEvent`` is triggered. Return true in
+        case of success, False in case of failure.
+        """
+
+    def set_order(contents):
+        """Replace the order with the given sequence of contents, in
+        one pass. Only one ``IContainerOrderChangedEvent`` is
+        triggered. Return True in case of modification, False if
+        nothing was changed.
+        """
+
     def get_position(content):
         """Return the position of a content, or -1 if the content is
-        unknown or has no position.
+        unknown or has no position. This should not require a scan of
+        the order list.
         """
 
     def __len__():
@@ -459,6 +723,108 @@ class ITreeContents(Interface):
         """
 
 
+class IStreamingTreeContents(ITreeContents):
+    """Flattened trees computed while they are iterated over.
+
+    Each ``iter_*`` method returns an iterator of batches. A batch is
+    a tuple ``(cursor, items)`` where ``items`` is a list of at most
+    ``batch_size`` indent, object tuples, and ``cursor`` an opaque
+    token that can be given back to the same method to resume the
+    iteration after that batch. The last batch has ``None`` as
+    cursor. Content is only loaded when its batch is generated.
+    """
+
+    def iter_tree(depth=-1, batch_size=100, cursor=None):
+        """Iterate in batches over the same items than ``get_tree``.
+        """
+
+    def iter_container_tree(depth=-1, batch_size=100, cursor=None):
+        """Iterate in batches over the same items than
+        ``get_container_tree``.
+        """
+
+    def iter_public_tree(depth=-1, batch_size=100, cursor=None):
+        """Iterate in batches over the same items than
+        ``get_public_tree``.
+        """
+
+    def iter_public_tree_all(depth=-1, batch_size=100, cursor=None):
+        """Iterate in batches over the same items than
+        ``get_public_tree_all``.
+        """
+
+    def iter_status_tree(depth=-1, batch_size=100, cursor=None):
+        """Iterate in batches over the same items than
+        ``get_status_tree``.
+        """
+
+
+class ITreeIndex(ITreeContents):
+    """Index of the flattened trees of a publication.
+
+    The ``ITreeContents`` methods are answered from the index, without
+    walking the containers.
+
+    The index is persistent and stored on the publication. Each
+    container of the publication has its own persistent entry, with
+    the ordered list of its contents, kept in an ``OOBTree`` keyed by
+    the path of the container relative to the publication. An event
+    only writes the entry of the container of the changed content,
+    and the ``OOBTree`` when a container is added or removed, so
+    changes in different containers don't conflict. Like any
+    persistent data, the index is seen by every ZEO client once the
+    transaction is committed.
+
+    Public status depends on time: an approved version becomes public
+    at its publication datetime, and a public version disappears at
+    its expiration datetime, without any event. The index stores for
+    each content the publication and expiration datetimes of its
+    approved and public versions, and ``get_public_tree`` and
+    ``get_public_tree_all`` filter on them with the current time when
+    they are called.
+
+    The index is kept up to date with the following events:
+
+    - ``IContentCreatedEvent`` and object moved events, including
+      the ones triggered by ``IContainerManager``, with ``index`` and
+      ``unindex``,
+
+    - ``IContentApprovedEvent``, ``IContentUnApprovedEvent``,
+      ``IContentPublishedEvent``, ``IContentClosedEvent`` and
+      ``IContentTOCVisibilityChangedEvent``, with ``reindex``,
+
+    - ``IContentOrderChangedEvent`` and
+      ``IContainerOrderChangedEvent`` (triggered by ``move_many`` and
+      ``set_order`` on ``IOrderManager``), with ``reorder``.
+
+    An index that ignores the events marked with ``IBatchedEvent``
+    must process the events of ``IContentEventsBatchedEvent``
+    instead.
+    """
+
+    def index(content):
+        """Add content, and any content it contains, to the index.
+        """
+
+    def unindex(content):
+        """Remove content, and any content it contains, from the
+        index.
+        """
+
+    def reindex(content):
+        """Update the publication and expiration datetimes of content
+        in the index, and whether it is hidden from table of contents.
+        """
+
+    def reorder(container):
+        """Update the order of the content of container in the index.
+        """
+
+    def rebuild():
+        """Clear the index and compute it again from the containers.
+        """
+
+
 class IGhostManager(Interface):
 
     def modify(target, identifier=None):
@@ -472,6 +838,71 @@ class IGhostManager(Interface):
 
 
 
+class IUpgradeCheckpoint(Interface):
+    """Adapt a Silva root to record the progress of an upgrade.
+
+    Progress is recorded by partition: ``upgrade`` uses a single
+    partition for the whole tree, ``upgrade_parallel`` one for each
+    subtree given to a worker. The partitions are created before the
+    workers start, and each one is stored in its own persistent
+    object, only written by the worker upgrading it, so the batch
+    commits of the workers don't conflict with each other.
+
+    A partition records a cursor, the path of the last object it
+    upgraded, instead of the set of processed objects: the tree is
+    traversed in a stable order (the contents of each container
+    sorted by identifier), so every object up to the cursor has been
+    upgraded. The size of the checkpoint depends on the number of
+    partitions, not on the size of the site. It is committed with the
+    upgraded objects, so it is consistent with them if the upgrade is
+    interrupted.
+    """
+    from_version = Attribute(u"Original version")
+    to_version = Attribute(u"Final version")
+    version = Attribute(u"Version currently being upgraded to")
+    workers = Attribute(
+        u"Number of workers used by the upgrade, or None if it is "
+        u"not parallel")
+    partitions = Attribute(
+        u"Mapping of partition names to the path of the root of "
+        u"their subtree, for the current version")
+
+    def add_partition(name, path):
+        """Record a partition name for the subtree at path, for the
+        current version.
+        """
+
+    def get_cursor(name):
+        """Return the path of the last object upgraded in the
+        partition name, or None if none was.
+        """
+
+    def set_cursor(name, path):
+        """Record path as the last object upgraded in the partition
+        name.
+        """
+
+    def is_done(name):
+        """Return True if all the objects of the partition name have
+        been upgraded for the current version.
+        """
+
+    def mark_done(name):
+        """Record that all the objects of the partition name have
+        been upgraded for the current version.
+        """
+
+    def next_version(version):
+        """Start recording the upgrade to version, removing the
+        partitions of the previous version.
+        """
+
+    def clear():
+        """Remove all recorded progress, once the upgrade is
+        finished.
+        """
+
+
 class IIcon(Interface):
     """An icon for a content type.
     """
@@ -178,7 +178,8 @@ class IAuthorizationManager(interface.Interface):
     def get_user_role(identifier=None):
         """Return a list of roles that ``identifier`` has. If ``identifier``
         is None, return a list of roles for currently authenticated
-        user.
+        user. Acquired roles are looked up in the
+        ``IEffectiveRoleCache`` if one is available.
         """
 
     def get_authorization(identifer=None, dont_acquire=False):
@@ -210,7 +211,92 @@ class IAuthorizationManager(interface.Interface):
         """
 
 
+class IBulkAuthorizationManager(interface.Interface):
+    """Adapter to look up authorizations of many users or groups on
+    many contents at once, below the adapted container.
+    """
+
+    def get_authorizations_matrix(contents, identifiers, dont_acquire=False):
+        """Return a dictionary mapping each content in ``contents`` to
+        a dictionary mapping each user or group in ``identifiers`` to
+        its authorization object on that content, with its local,
+        acquired and effective role.
+
+        The contents are visited in one pass from the adapted
+        container, so acquired roles are computed only once for
+        contents sharing the same parent.
+
+        If ``dont_acquire`` is set to True, no acquired roles would be
+        looked up (only local roles).
+        """
+
+
+class IEffectiveRoleCache(interface.Interface):
+    """Cache the effective roles of users and groups by container,
+    used by ``IAuthorizationManager`` to avoid looking up acquired
+    roles in the parents.
+
+    Entries are keyed by the physical path and the persistent
+    identifier of the container, and by the security generation of
+    each publication from the Silva root to the container. The
+    generation is a counter stored persistently on each publication.
+
+    On ``ISecurityRoleAddedEvent``, ``ISecurityRoleRemovedEvent`` and
+    ``ISecurityRestrictionModifiedEvent`` triggered on a container,
+    the generation of that container if it is a publication, or of
+    the publication containing it otherwise, is incremented with
+    ``increment_generation``, in the transaction making the
+    change. This invalidates the entries of that publication and of
+    the publications below it, in every process once the transaction
+    is committed, and only writes that publication. On
+    ``ISecurityGroupMembershipChangedEvent`` the generation of the
+    Silva root is incremented.
+
+    Adding or removing a content never changes a generation: a new
+    content has no entries yet, and the entries of a removed content
+    are no longer used. A move or a rename (an ``IObjectMovedEvent``
+    with both ``oldParent`` and ``newParent`` set) changes the path
+    of the content, so the entries cached with the old path are no
+    longer used either. It only calls ``invalidate`` on the old
+    location to free them in this process.
+
+    The cache lives in the memory of one process. Group membership
+    can be stored outside of the ZODB, so entries also expire after
+    ``timeout`` seconds.
+    """
+    timeout = interface.Attribute(
+        u"Number of seconds after which a cached entry expires.")
+
+    def get_generation(publication):
+        """Return the security generation stored on publication.
+        """
+
+    def increment_generation(publication):
+        """Increment the security generation stored on publication.
+        """
+
+    def get_roles(container, identifier, default=None):
+        """Return the cached effective roles of the user or group
+        ``identifier`` in container, or default.
+        """
+
+    def set_roles(container, identifier, roles):
+        """Cache the effective roles of the user or group
+        ``identifier`` in container.
+        """
+
+    def invalidate(container):
+        """Invalidate the cached roles of container and of all the
+        containers below it, in this process only.
+        """
+
+    def clear():
+        """Invalidate all the cached roles, in this process.
+        """
+
+
 __all__ = [
     'IMember', 'IEditableMember', 'IGroup',
     'IAccessSecurity', 'IAuthorizationManager', 'IAuthorization',
+    'IBulkAuthorizationManager', 'IEffectiveRoleCache',
     'authenticated_role_vocabulary', 'role_vocabulary']
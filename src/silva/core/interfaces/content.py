@@ -276,7 +276,8 @@ class IFolder(IOrderableContainer):
         """Set the list of addables explicitly allowed in this
         container.  If 'addables' is set to None the list is acquired
         from the container higher in the hierarchy. If this is the
-        root, return the complete list.
+        root, return the complete list. This triggers an
+        ``IAddablesChangedEvent``.
         """
 
     def get_silva_addables_allowed_in_container():
@@ -312,11 +313,12 @@ class IRoot(IPublication):
         """Forbid use of meta_type in SMI. The meta_type won't show
         up anymore, including in the publication metadata tab where
         individual items can be disabled for particular publications.
+        This triggers an ``IAddablesChangedEvent``.
         """
 
     def clear_silva_addables_forbidden():
         """Clear any forbidden addables. All addables show up in the
-        SMI again.
+        SMI again. This triggers an ``IAddablesChangedEvent``.
         """
 
     def is_silva_addable_forbidden(meta_type):
@@ -618,7 +620,11 @@ class IFile(IDownloableAsset, IDirectlyRendered):
         """Re-upload data for this file object. It will change the
         ``content_type`` and ``content_encoding``, however id, title,
         etc. will not change. If ``content_type`` is None, it will be
-        detected with ``content_encoding``, if possible.
+        detected with ``content_encoding``, if possible. The stream
+        is read once, by chunks, with the help of ``IFileUpload``. If
+        an ``IContentAddressedStore`` is available, the chunks are
+        written in it (the data is kept once for identical data) and
+        the file only keeps its digest.
         """
 
     def set_text(text):
@@ -47,6 +47,22 @@ class InstalledExtensionEvent(ObjectEvent):
         self.root = root
 
 
+class IUninstalledExtensionEvent(IObjectEvent):
+    """An extension have been uninstalled.
+    """
+    root = Attribute(u"Root from which the extension have been uninstalled")
+    extension = Attribute(u"Extension that have been uninstalled")
+
+
+class UninstalledExtensionEvent(ObjectEvent):
+    implements(IUninstalledExtensionEvent)
+
+    def __init__(self, extension, root):
+        super(UninstalledExtensionEvent, self).__init__(extension.installer)
+        self.extension = extension
+        self.root = root
+
+
 class IInstalledServiceEvent(IObjectEvent):
     """A service has been installed.
 
@@ -92,6 +108,18 @@ class ContentCreatedEvent(ObjectCreatedEvent):
         self.no_default_content = no_default_content
 
 
+# Addables
+
+class IAddablesChangedEvent(IObjectEvent):
+    """The addables allowed or forbidden in a container have been
+    changed.
+    """
+
+
+class AddablesChangedEvent(ObjectEvent):
+    implements(IAddablesChangedEvent)
+
+
 # Ordered content move
 
 class IContentOrderChangedEvent(IObjectEvent):
@@ -110,6 +138,46 @@ class ContentOrderChangedEvent(ObjectEvent):
         self.old_position = old_position
 
 
+class IContainerOrderChangedEvent(IObjectEvent):
+    """The order of multiple contents have changed at once in an
+    ordered container. The event object is the container.
+    """
+    old_order = Attribute(u"Order of the contents before the change")
+    new_order = Attribute(u"Order of the contents after the change")
+
+
+class ContainerOrderChangedEvent(ObjectEvent):
+    implements(IContainerOrderChangedEvent)
+
+    def __init__(self, obj, new_order, old_order):
+        super(ContainerOrderChangedEvent, self).__init__(obj)
+        self.new_order = new_order
+        self.old_order = old_order
+
+
+# Batched events
+
+class IBatchedEvent(Interface):
+    """Marker set on events collected by an ``IContainerEventBatch``.
+    They will be dispatched again in an ``IContentEventsBatchedEvent``.
+    """
+
+
+class IContentEventsBatchedEvent(IObjectEvent):
+    """Events collected during a bulk operation on a container are
+    dispatched at once.
+    """
+    events = Attribute(u"List of collected events, in firing order")
+
+
+class ContentEventsBatchedEvent(ObjectEvent):
+    implements(IContentEventsBatchedEvent)
+
+    def __init__(self, obj, events):
+        super(ContentEventsBatchedEvent, self).__init__(obj)
+        self.events = events
+
+
 # Content publication
 
 class IPublishingEvent(IObjectModifiedEvent):
@@ -173,6 +241,13 @@ class IContentExpiredEvent(IContentClosedEvent):
     """
 
 
+class IContentTOCVisibilityChangedEvent(IObjectEvent):
+    """A content have been hidden from, or shown again in, table of
+    contents.
+    """
+    hidden = Attribute(u"True if the content is now hidden from tocs")
+
+
 class PublishingEvent(ObjectModifiedEvent):
     implements(IPublishingEvent)
 
@@ -219,6 +294,14 @@ class ContentExpiredEvent(ContentClosedEvent):
     implements(IContentExpiredEvent)
 
 
+class ContentTOCVisibilityChangedEvent(ObjectEvent):
+    implements(IContentTOCVisibilityChangedEvent)
+
+    def __init__(self, obj, hidden):
+        super(ContentTOCVisibilityChangedEvent, self).__init__(obj)
+        self.hidden = hidden
+
+
 # Content import/export
 
 class IContentImportedExported(IObjectEvent):
@@ -278,6 +361,16 @@ class ISecurityRoleRemovedEvent(ISecurityRoleChangedEvent):
     """
 
 
+class ISecurityGroupMembershipChangedEvent(ISecurityEvent):
+    """The members of a group have changed. The event object is the
+    group.
+    """
+    groupid = Attribute(u"Identifier of the group.")
+    added = Attribute(u"Identifiers of the members added to the group.")
+    removed = Attribute(
+        u"Identifiers of the members removed from the group.")
+
+
 class SecurityRestrictionModifiedEvent(ObjectEvent):
     implements(ISecurityRestrictionModifiedEvent)
 
@@ -295,6 +388,16 @@ class SecurityRoleChangedEvent(ObjectEvent):
         self.roles = roles
 
 
+class SecurityGroupMembershipChangedEvent(ObjectEvent):
+    implements(ISecurityGroupMembershipChangedEvent)
+
+    def __init__(self, obj, groupid, added=(), removed=()):
+        super(SecurityGroupMembershipChangedEvent, self).__init__(obj)
+        self.groupid = groupid
+        self.added = added
+        self.removed = removed
+
+
 class SecurityRoleAddedEvent(SecurityRoleChangedEvent):
     implements(ISecurityRoleAddedEvent)
 
@@ -312,6 +415,18 @@ class IUpgradeEvent(IObjectEvent):
     to_version = Attribute(u"Final version")
 
 
+class IUpgradeProgressEvent(IUpgradeEvent):
+    """Upgrade progressed. It is triggered periodically during an
+    upgrade.
+    """
+    version = Attribute(u"Version currently being upgraded to")
+    processed = Attribute(u"Number of objects processed for this version")
+    rate = Attribute(u"Number of objects processed per second")
+    remaining = Attribute(
+        u"Estimated number of seconds remaining for this version, or None")
+    errors = Attribute(u"Number of errors for this version")
+
+
 class IUpgradeTransaction(Interface):
     """A new upgrade transaction has started.
     """
@@ -341,6 +456,21 @@ class UpgradeStartedEvent(ObjectEvent):
         self.to_version = to_version
 
 
+class UpgradeProgressEvent(ObjectEvent):
+    implements(IUpgradeProgressEvent)
+
+    def __init__(self, obj, from_version, to_version, version,
+                 processed, rate, remaining=None, errors=0):
+        super(UpgradeProgressEvent, self).__init__(obj)
+        self.from_version = from_version
+        self.to_version = to_version
+        self.version = version
+        self.processed = processed
+        self.rate = rate
+        self.remaining = remaining
+        self.errors = errors
+
+
 class UpgradeFinishedEvent(ObjectEvent):
     implements(IUpgradeFinishedEvent)
 
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013 Infrae. All rights reserved.
+# See also LICENSE.txt
+
+from array import array
+
+from zope.interface import providedBy
+from zope.interface.interface import InterfaceClass
+from silva.core.interfaces import content as _content
+
+
+def _content_interfaces():
+    interfaces = [
+        value for value in vars(_content).values()
+        if (isinstance(value, InterfaceClass) and
+            value.__module__ == _content.__name__)]
+    interfaces.sort(key=lambda iface: iface.__name__)
+    return tuple(interfaces)
+
+# Interfaces defined in silva.core.interfaces.content.
+CONTENT_INTERFACES = _content_interfaces()
+
+_ancestors = dict(
+    (iface, frozenset(iface.__iro__)) for iface in CONTENT_INTERFACES)
+
+# Compact flags for the questions commonly asked about a content in
+# listings. They fit in an unsigned long.
+CLASSIFIED_INTERFACES = (
+    _content.ISilvaObject,
+    _content.IPublishable,
+    _content.INonPublishable,
+    _content.IContainer,
+    _content.IOrderableContainer,
+    _content.IFolder,
+    _content.IPublication,
+    _content.IRoot,
+    _content.IContent,
+    _content.IVersionedObject,
+    _content.IVersionedContent,
+    _content.IVersionedNonPublishable,
+    _content.IAsset,
+    _content.IFile,
+    _content.IImage,
+    _content.ILink,
+    _content.IGhostAware,
+    _content.IGhost,
+    _content.IGhostFolder,
+    _content.IGhostAsset,
+    _content.IViewableObject,
+    _content.IDirectlyRendered,
+    )
+
+(SILVA_OBJECT, PUBLISHABLE, NON_PUBLISHABLE, CONTAINER,
+ ORDERABLE_CONTAINER, FOLDER, PUBLICATION, ROOT, CONTENT,
+ VERSIONED_OBJECT, VERSIONED_CONTENT, VERSIONED_NON_PUBLISHABLE,
+ ASSET, FILE, IMAGE, LINK, GHOST_AWARE, GHOST, GHOST_FOLDER,
+ GHOST_ASSET, VIEWABLE, DIRECTLY_RENDERED) = [
+    1 << index for index in range(len(CLASSIFIED_INTERFACES))]
+
+_interface_flags = dict(
+    (iface, 1 << index) for index, iface in enumerate(CLASSIFIED_INTERFACES))
+
+# Flags by providedBy specification. Specifications are shared by all
+# instances of a class (and by instances of a class directly
+# providing the same interfaces), so this stays small. A plain
+# dictionary is used, as a WeakKeyDictionary lookup costs more than
+# the interface checks it would save.
+_flags = {}
+
+
+class _Invalidation(object):
+    """Subscribed to the cached specifications. They are modified in
+    place when interfaces are added to a class (with
+    ``classImplements``, from ZCML or grok), or to one of its bases.
+    This happens rarely, so all the flags are computed again.
+    """
+
+    def changed(self, originally_changed):
+        _flags.clear()
+
+_invalidation = _Invalidation()
+
+
+def _compute_flags(spec):
+    flags = 0
+    for iface in spec.__iro__:
+        flags |= _interface_flags.get(iface, 0)
+    spec.subscribe(_invalidation)
+    _flags[spec] = flags
+    return flags
+
+
+def get_ancestors(interface):
+    """Return a frozenset with the interface and all the interfaces it
+    extends.
+    """
+    try:
+        return _ancestors[interface]
+    except KeyError:
+        return frozenset(interface.__iro__)
+
+
+def get_flag(interface):
+    """Return the classification flag associated to interface, or
+    None if it is not classified.
+    """
+    return _interface_flags.get(interface)
+
+
+def get_flags(content):
+    """Return the classification flags of content.
+
+    To test a single interface on a single content, use
+    ``interface.providedBy(content)``, it is faster. This is useful
+    to test several interfaces on the same content.
+    """
+    spec = providedBy(content)
+    flags = _flags.get(spec)
+    if flags is None:
+        flags = _compute_flags(spec)
+    return flags
+
+
+def classify(contents):
+    """Return an array with the classification flags of each given
+    content, in order.
+    """
+    result = array('L')
+    append = result.append
+    lookup = _flags.get
+    for content in contents:
+        spec = providedBy(content)
+        flags = lookup(spec)
+        if flags is None:
+            flags = _compute_flags(spec)
+        append(flags)
+    return result
@@ -57,7 +57,14 @@ class IUpgradeRegistry(IRegistry):
         """
 
     def get_upgraders(version, meta_type):
-        """Return the registered upgrade_handlers of meta_type.
+        """Return the registered upgrade_handlers of meta_type. They
+        are computed once per version and meta_type.
+        """
+
+    def get_applicable_upgraders(version, content):
+        """Return the upgraders of the meta_type of content, without
+        the ``IStaticUpgrader`` that do not apply to its class. The
+        result is computed once per version and class.
         """
 
     def upgrade_tree(obj, version):
@@ -66,5 +73,113 @@ class IUpgradeRegistry(IRegistry):
 
     def upgrade(root, from_version, to_version):
         """Upgrade obj and all its children for all version between
-        from_version and to_version.
+        from_version and to_version. Progress is recorded in a single
+        partition of the ``IUpgradeCheckpoint`` of root, committed
+        periodically, and ``IUpgradeProgressEvent`` are triggered.
+        """
+
+    def upgrade_parallel(root, from_version, to_version,
+                         workers=4, batch_size=500, retries=3):
+        """Upgrade root and all its children for all version between
+        from_version and to_version, using workers processes.
+
+        For each version, the tree is split in independent subtrees,
+        recorded as partitions of the ``IUpgradeCheckpoint`` of root
+        and committed before the workers start. The subtrees are
+        upgraded concurrently, each worker using its own ZODB
+        connection, committing a transaction every batch_size objects
+        and recording its progress only in the checkpoint of its
+        partition. A batch failing with a conflict error is retried
+        up to retries times. ``IPostUpgrader`` upgraders are run only
+        once all the partitions are done.
+        """
+
+    def resume(root, from_version, to_version):
+        """Resume an interrupted ``upgrade`` or ``upgrade_parallel``
+        of root from its ``IUpgradeCheckpoint``.
+
+        The upgrade is continued the way it was started: with the
+        same partitions and number of workers if it was parallel,
+        serially otherwise. Partitions that are done are skipped, and
+        in the other ones the objects up to their cursor are
+        skipped.
+        """
+
+    def profile_tree(obj, version):
+        """Run ``upgrade_tree`` for obj and version without changing
+        the database, and return an ``IUpgradeProfile`` describing the
+        cost of each upgrader.
+
+        The intermediate commits done by ``upgrade_tree`` are
+        replaced with savepoints, no ``IUpgradeCheckpoint`` is
+        recorded, and the transaction is aborted at the end.
+        """
+
+
+class IUpgradeProfile(interface.Interface):
+    """Cost of the upgraders measured during a dry-run upgrade.
+    """
+    version = interface.Attribute(u"Profiled version")
+    upgraders = interface.Attribute(
+        u"List of dictionaries, one per upgrader, with the keys "
+        u"``upgrader``, ``calls``, ``time`` (cumulative, in seconds) "
+        u"and ``changed`` (number of changed objects).")
+    upgrade_errors = interface.Attribute(
+        u"Number of ``UpgradeError`` raised.")
+    bundle_errors = interface.Attribute(
+        u"Number of ``ContentErrorBundle`` raised.")
+
+    def as_json():
+        """Return the report as a JSON string.
+        """
+
+    def as_csv():
+        """Return the report as a CSV string, with one line per
+        upgrader.
+        """
+
+
+class IAddableContentsCache(IRegistry):
+    """Cache the results of ``IAddableContents``, keyed by container,
+    required interface, user roles and addables generation.
+
+    Like any registry, the cache lives in the memory of one process,
+    while events are only triggered in the process that made the
+    change. The addables generation is a counter stored persistently
+    on the Silva root, that must be incremented (with
+    ``increment_generation``), in the transaction that changes the
+    addables, on ``IAddablesChangedEvent`` (triggered by
+    ``set_silva_addables_allowed_in_container``,
+    ``add_silva_addable_forbidden`` and
+    ``clear_silva_addables_forbidden``), on
+    ``IInstalledExtensionEvent`` and on
+    ``IUninstalledExtensionEvent``. Other processes read the new
+    generation once the transaction is committed, and stop using the
+    entries cached with the previous one.
+    """
+
+    def get_generation(root):
+        """Return the addables generation stored on the Silva root.
+        """
+
+    def increment_generation(root):
+        """Increment the addables generation stored on the Silva
+        root, and invalidate the cached addables of this process.
+        """
+
+    def get(container, require, roles, default=None):
+        """Return the cached list of addables for container, require
+        and roles, computed with the current addables generation, or
+        default.
+        """
+
+    def set(container, require, roles, addables):
+        """Cache the list of addables for container, require and
+        roles, with the current addables generation.
+        """
+
+    def invalidate(container=None):
+        """Free the cached addables of container and of the
+        containers below it, or of all containers if container is
+        None, in this process.
         """
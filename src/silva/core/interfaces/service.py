@@ -3,6 +3,7 @@
 # See also LICENSE.txt
 
 import zope.deferredimport
+from zope.interface import Interface, Attribute
 from grokcore.component.interfaces import IContext
 from silva.core.interfaces.content import IReferable
 
@@ -44,6 +45,81 @@ class ISilvaInvisibleService(ISilvaService):
 IInvisibleService = ISilvaInvisibleService
 
 
+class IContentAddressedStore(ISilvaService):
+    """Store file data once, identified by its SHA-256 digest, and
+    shared by all the files that have the same data.
+
+    Data is written by chunks with a writer of the store, that
+    computes the digest and the size while spooling it, so a stream
+    is read only once. ``IFileUpload`` feeds the chunks it reads to a
+    writer, and uses the first one to detect the content type.
+
+    Files only keep the digest of their data. They can be copied,
+    ghosted or pasted by ZODB and OFS without the store knowing, so
+    the store does not count references: unused data is deleted by
+    ``collect``, that marks the digests used by all the files of the
+    site and sweeps the others.
+
+    Each file holding a digest still accounts its full size in the
+    quota, so ``IQuotaContainer.used_space`` does not depend on the
+    deduplication.
+    """
+
+    def open_writer():
+        """Return a new ``IContentAddressedStoreWriter`` to store
+        data written by chunks.
+        """
+
+    def store(stream):
+        """Store the data read by chunks from stream with a writer,
+        and return a tuple (digest, size). The digest is always
+        computed by the store: a digest given by the caller is never
+        trusted.
+        """
+
+    def has_data(digest):
+        """Return True if the data identified by digest is stored.
+        """
+
+    def open_data(digest):
+        """Return a read-only file object to access the data
+        identified by digest. It raises ``KeyError`` if it is not
+        stored.
+        """
+
+    def get_size(digest):
+        """Return the size in bytes of the data identified by digest.
+        """
+
+    def collect(root, grace=86400):
+        """Delete the data not used by any file below root, the root
+        of the site. Data stored less than grace seconds ago is kept,
+        since it can be used by a transaction not yet committed.
+        Return the number of deleted data.
+        """
+
+
+class IContentAddressedStoreWriter(Interface):
+    """Spool data written by chunks for an ``IContentAddressedStore``,
+    computing its SHA-256 digest and its size while it is written.
+    """
+    size = Attribute(u"Number of bytes written so far.")
+
+    def write(chunk):
+        """Spool chunk and update the digest and the size.
+        """
+
+    def close():
+        """Finish writing, and return a tuple (digest, size). The
+        spooled data is moved in the store, or discarded if the same
+        data is already stored.
+        """
+
+    def abort():
+        """Discard the spooled data.
+        """
+
+
 class IMessageService(ISilvaService, ISilvaLocalService):
     """Send messages to members.
     """
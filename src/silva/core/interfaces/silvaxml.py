@@ -2,7 +2,7 @@
 # Copyright (c) 2002-2013 Infrae. All rights reserved.
 # See also LICENSE.txt
 
-from zope.interface import Interface
+from zope.interface import Interface, Attribute
 
 
 class ISettings(Interface):
@@ -13,6 +13,24 @@ class ISettings(Interface):
 class IExportSettings(ISettings):
     """ export settings
     """
+    modified_since = Attribute(
+        u"If not None, only export content modified since this datetime.")
+
+    def is_exported(content):
+        """Return True if content is inside the exported tree. The
+        exported tree is indexed once per export, so this does not
+        depend on the size of the tree.
+        """
+
+    def report_external_reference(error):
+        """Record an ``ExternalReferenceError`` instead of raising
+        it, so all of them can be reported at once.
+        """
+
+    def get_external_references_error():
+        """Return a ``ContentErrorBundle`` of all the recorded
+        ``ExternalReferenceError``, or None if there are none.
+        """
 
 
 class IImportSettings(ISettings):